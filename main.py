@@ -2,41 +2,54 @@ import sys
 import requests
 import os
 import datetime
+import io
+import gzip
 import json
+import re
+import time
+import socket
+import subprocess
+import multiprocessing
+import email.utils
+import xml.etree.ElementTree as ElementTree
+import codecs
+import sqlite3
+import argparse
+from contextlib import closing
+from html import unescape
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urldefrag, urlsplit, urlunsplit
 from bs4 import BeautifulSoup
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    detect_charset = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QLineEdit, QTextEdit,
                             QLabel, QComboBox, QStatusBar, QTabWidget,
                             QProgressBar, QFileDialog, QGroupBox, QCheckBox,
                             QMessageBox, QSplitter, QSlider, QSizePolicy)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QPalette, QColor, QFont, QIcon
 
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
 class ScraperThread(QThread):
     progress_signal = pyqtSignal(int)
     result_signal = pyqtSignal(str, str)
     error_signal = pyqtSignal(str)
 
-    def __init__(self, url, timeout=30, user_agent=None):
+    def __init__(self, url, timeout=30, user_agent=None, page_index=None):
         super().__init__()
         self.url = url
         self.timeout = timeout
-        self.user_agent = user_agent or 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.page_index = page_index
 
     def run(self):
         try:
-            self.progress_signal.emit(10)
-            headers = {'User-Agent': self.user_agent}
-
-            self.progress_signal.emit(30)
-            response = requests.get(self.url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-
-            self.progress_signal.emit(70)
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            title = soup.title.string if soup.title else 'No title'
-
+            html_content, title = fetch_page(self.url, self.timeout, self.user_agent,
+                                             self.page_index, self.progress_signal.emit)
             self.progress_signal.emit(100)
             self.result_signal.emit(html_content, title)
 
@@ -44,6 +57,93 @@ class ScraperThread(QThread):
             self.error_signal.emit(str(e))
             self.progress_signal.emit(0)
 
+# Download and decode one page, returning its text and final URL (after redirects).
+# Callers that only scan the markup use this directly and never build a parse tree.
+def fetch_html(url, timeout=30, user_agent=None):
+    headers = {'User-Agent': user_agent or DEFAULT_USER_AGENT}
+    response = requests.get(url, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    html_content, _ = decode_html(response.content, response.headers.get('Content-Type', ''))
+    return html_content, response.url
+
+# Fetch, decode, parse and index one page. Shared by the GUI thread and the queue workers.
+def fetch_page(url, timeout=30, user_agent=None, page_index=None, progress=lambda value: None):
+    progress(30)
+    html_content, final_url = fetch_html(url, timeout, user_agent)
+
+    progress(70)
+    soup = BeautifulSoup(html_content, 'html.parser')
+    title = soup.title.string if soup.title else 'No title'
+
+    # Record every link and image on the page, not just the ones shown by the extractor,
+    # along with its visible text for full-text search. The page is keyed by its final URL,
+    # the same base its relative links are resolved against.
+    if page_index is not None:
+        progress(85)
+        links = collect_urls(soup, 'a', 'href', final_url)
+        images = collect_urls(soup, 'img', 'src', final_url)
+        page_index.add_page(final_url, links, images, title, page_text(soup))
+
+    return html_content, title
+
+# Byte order marks, longest first (the UTF-32 LE mark starts with the UTF-16 LE one)
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'), (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.I)
+SNIFF_BYTES = 1024
+DETECT_BYTES = 64 * 1024
+# Labels browsers decode as windows-1252; an ASCII guess from a prefix says nothing about the rest
+BROWSER_ENCODINGS = {'ascii': 'cp1252', 'iso8859-1': 'cp1252'}
+
+def known_encoding(name):
+    try:
+        encoding = codecs.lookup(name).name
+    except LookupError:
+        return None
+    return BROWSER_ENCODINGS.get(encoding, encoding)
+
+def sniff_encoding(content, content_type=''):
+    # Cheap checks first: BOM, Content-Type header, then <meta charset> in the first KB
+    for bom, encoding in BOM_ENCODINGS:
+        if content.startswith(bom):
+            return encoding
+
+    match = HEADER_CHARSET.search(content_type or '')
+    if match and known_encoding(match.group(1)):
+        return known_encoding(match.group(1))
+
+    match = META_CHARSET.search(content[:SNIFF_BYTES])
+    if match:
+        encoding = known_encoding(match.group(1).decode('ascii', 'ignore'))
+        # A page readable enough to carry an ASCII <meta> cannot really be UTF-16/32
+        if encoding and not encoding.startswith(('utf-16', 'utf-32')):
+            return encoding
+        if encoding:
+            return 'utf-8'
+    return None
+
+def decode_html(content, content_type=''):
+    # Returns (text, encoding). Unlike response.text, detection never scans the whole body.
+    encoding = sniff_encoding(content, content_type)
+    if encoding:
+        return content.decode(encoding, errors='replace'), encoding
+
+    try:
+        return content.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    encoding = 'cp1252'
+    if detect_charset is not None:
+        best = detect_charset(content[:DETECT_BYTES]).best()
+        if best is not None and known_encoding(best.encoding):
+            encoding = known_encoding(best.encoding)
+    return content.decode(encoding, errors='replace'), encoding
+
 class ExtractorThread(QThread):
     progress_signal = pyqtSignal(int)
     result_signal = pyqtSignal(str)
@@ -62,60 +162,956 @@ class ExtractorThread(QThread):
     def run(self):
         try:
             self.progress_signal.emit(20)
-            soup = BeautifulSoup(self.html_content, 'html.parser')
-            elements = soup.select(self.selector)
-
-            self.progress_signal.emit(50)
+            result = extract_elements(self.html_content, self.selector, self.extract_text,
+                                      self.extract_links, self.extract_images, self.extract_html)
+            self.progress_signal.emit(100)
+            self.result_signal.emit(result)
 
-            if not elements:
-                self.result_signal.emit(f"No elements found matching selector: {self.selector}")
-                self.progress_signal.emit(100)
-                return
+        except Exception as e:
+            self.error_signal.emit(str(e))
+            self.progress_signal.emit(0)
 
-            result = f"Found {len(elements)} elements matching '{self.selector}':\n\n"
-
-            for i, element in enumerate(elements, 1):
-                result += f"--- Element {i} ---\n"
-
-                if self.extract_text:
-                    result += f"Text: {element.get_text(strip=True)}\n"
-
-                if self.extract_links and element.name == 'a':
-                    result += f"Link: {element.get('href', 'No link')}\n"
-                elif self.extract_links:
-                    links = element.find_all('a')
-                    if links:
-                        result += "Links found:\n"
-                        for j, link in enumerate(links[:5], 1):
-                            result += f"  {j}. {link.get('href', 'No link')}\n"
-                        if len(links) > 5:
-                            result += f"  ... and {len(links) - 5} more links\n"
-
-                if self.extract_images:
-                    images = element.find_all('img')
-                    if images:
-                        result += "Images found:\n"
-                        for j, img in enumerate(images[:3], 1):
-                            result += f"  {j}. {img.get('src', 'No source')} - Alt: {img.get('alt', 'No alt text')}\n"
-                        if len(images) > 3:
-                            result += f"  ... and {len(images) - 3} more images\n"
-
-                if self.extract_html:
-                    html = str(element)
-                    if len(html) > 500:
-                        result += f"HTML: {html[:500]}...\n"
-                    else:
-                        result += f"HTML: {html}\n"
+def extract_elements(html_content, selector, extract_text=True, extract_links=True,
+                     extract_images=False, extract_html=False):
+    soup = BeautifulSoup(html_content, 'html.parser')
+    elements = soup.select(selector)
+
+    if not elements:
+        return f"No elements found matching selector: {selector}"
+
+    result = f"Found {len(elements)} elements matching '{selector}':\n\n"
+
+    for i, element in enumerate(elements, 1):
+        result += f"--- Element {i} ---\n"
+
+        if extract_text:
+            result += f"Text: {element.get_text(strip=True)}\n"
+
+        if extract_links and element.name == 'a':
+            result += f"Link: {element.get('href', 'No link')}\n"
+        elif extract_links:
+            links = element.find_all('a')
+            if links:
+                result += "Links found:\n"
+                for j, link in enumerate(links[:5], 1):
+                    result += f"  {j}. {link.get('href', 'No link')}\n"
+                if len(links) > 5:
+                    result += f"  ... and {len(links) - 5} more links\n"
+
+        if extract_images:
+            images = element.find_all('img')
+            if images:
+                result += "Images found:\n"
+                for j, img in enumerate(images[:3], 1):
+                    result += f"  {j}. {img.get('src', 'No source')} - Alt: {img.get('alt', 'No alt text')}\n"
+                if len(images) > 3:
+                    result += f"  ... and {len(images) - 3} more images\n"
+
+        if extract_html:
+            html = str(element)
+            if len(html) > 500:
+                result += f"HTML: {html[:500]}...\n"
+            else:
+                result += f"HTML: {html}\n"
+
+        result += "\n"
+
+    return result
+
+class StructuredDataThread(QThread):
+    progress_signal = pyqtSignal(int)
+    result_signal = pyqtSignal(str)
+    error_signal = pyqtSignal(str)
 
-                result += "\n"
+    def __init__(self, url, timeout=30, user_agent=None, html_content=None):
+        super().__init__()
+        self.url = url
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.html_content = html_content
 
+    def run(self):
+        try:
+            self.progress_signal.emit(20)
+            # Reuse an already scraped page, otherwise take the fast path without a parse tree
+            html_content = self.html_content
+            if html_content is None:
+                html_content, _ = fetch_html(self.url, self.timeout, self.user_agent)
+                self.progress_signal.emit(70)
+            data = extract_structured_data(html_content)
             self.progress_signal.emit(100)
+
+            if not any(data.values()):
+                self.result_signal.emit("No JSON-LD, microdata or meta fields found")
+                return
+
+            result = f"Found {len(data['json_ld'])} JSON-LD records, {len(data['microdata'])} microdata items "
+            result += f"and {len(data['meta'])} meta fields:\n\n"
+            result += json.dumps(data, indent=2, ensure_ascii=False)
             self.result_signal.emit(result)
 
         except Exception as e:
             self.error_signal.emit(str(e))
             self.progress_signal.emit(0)
 
+# Microdata property values that come from an attribute rather than the element's text
+MICRODATA_VALUE_ATTRIBUTES = {
+    'meta': 'content', 'a': 'href', 'area': 'href', 'link': 'href',
+    'img': 'src', 'audio': 'src', 'video': 'src', 'source': 'src', 'embed': 'src',
+    'iframe': 'src', 'track': 'src', 'object': 'data', 'time': 'datetime',
+    'data': 'value', 'meter': 'value',
+}
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+}
+# Elements whose end tag is implied when one of these start tags opens (a subset of the HTML rules)
+P_CLOSERS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav',
+    'ol', 'p', 'pre', 'section', 'table', 'ul',
+}
+IMPLIED_END_TAGS = {
+    'p': P_CLOSERS, 'li': {'li'}, 'dt': {'dt', 'dd'}, 'dd': {'dt', 'dd'},
+    'option': {'option', 'optgroup'}, 'optgroup': {'optgroup'},
+    'tr': {'tr'}, 'td': {'td', 'th', 'tr'}, 'th': {'td', 'th', 'tr'},
+}
+# Elements holding escapable text only: markup inside them is not parsed, entities still are.
+# Python versions that know this (RCDATA_CONTENT_ELEMENTS) already tokenise them that way.
+RCDATA_ELEMENTS = {'textarea', 'title'}
+META_PREFIXES = ('og:', 'twitter:', 'article:', 'product:', 'book:', 'profile:', 'music:', 'video:')
+META_NAMES = {'description', 'keywords', 'author', 'robots'}
+
+# Single tokenizer pass collecting JSON-LD, microdata and OpenGraph/meta fields; no tree is built
+class StructuredDataParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.json_ld = []
+        self.microdata = []
+        self.meta = {}
+        self.script_parts = None
+        self.in_raw_text = False
+        self.in_rcdata = False
+        self.open_elements = []  # (tag, opened item or None, property names or None, text parts or None)
+        self.items = []
+
+    def add_meta(self, key, value):
+        # Repeated keys (e.g. several og:image) become lists
+        if key not in self.meta:
+            self.meta[key] = value
+        elif isinstance(self.meta[key], list):
+            self.meta[key].append(value)
+        else:
+            self.meta[key] = [self.meta[key], value]
+
+    def add_property(self, names, value):
+        properties = self.items[-1]['properties']
+        for name in names:
+            properties.setdefault(name, []).append(value)
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+
+        if tag == 'script' and (attributes.get('type') or '').strip().lower() == 'application/ld+json':
+            self.script_parts = []
+            return
+        if tag in ('script', 'style'):
+            self.in_raw_text = True
+
+        # A new <p>, <li>, <option>... ends an open sibling that was never closed
+        while self.open_elements and tag in IMPLIED_END_TAGS.get(self.open_elements[-1][0], ()):
+            self.close_element()
+        if tag == 'meta' and attributes.get('content') is not None:
+            key = (attributes.get('property') or attributes.get('name') or '').strip().lower()
+            if key.startswith(META_PREFIXES) or key in META_NAMES:
+                self.add_meta(key, attributes['content'])
+
+        names = (attributes.get('itemprop') or '').split() if self.items else []
+        item = None
+        text_parts = None
+
+        if 'itemscope' in attributes:
+            item = {'type': attributes.get('itemtype'), 'properties': {}}
+            if names:
+                self.add_property(names, item)
+            else:
+                self.microdata.append(item)
+            self.items.append(item)
+        elif names:
+            value_attribute = MICRODATA_VALUE_ATTRIBUTES.get(tag)
+            if value_attribute and (tag != 'time' or attributes.get(value_attribute) is not None):
+                self.add_property(names, attributes.get(value_attribute) or '')
+            elif tag in VOID_ELEMENTS:
+                self.add_property(names, '')
+            else:
+                text_parts = []
+
+        if tag in VOID_ELEMENTS:
+            if item is not None:
+                self.items.pop()
+            return
+        self.open_elements.append((tag, item, names if text_parts is not None else None, text_parts))
+        if tag in RCDATA_ELEMENTS and not hasattr(HTMLParser, 'RCDATA_CONTENT_ELEMENTS'):
+            self.set_cdata_mode(tag)
+            self.in_rcdata = True
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_data(self, data):
+        if self.script_parts is not None:
+            self.script_parts.append(data)
+            return
+        if self.in_raw_text:
+            return
+        if self.in_rcdata:
+            # Text in cdata mode reaches us with its character references unconverted
+            data = unescape(data)
+        for _, _, _, text_parts in self.open_elements:
+            if text_parts is not None:
+                text_parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'script' and self.script_parts is not None:
+            self.add_json_ld(''.join(self.script_parts))
+            self.script_parts = None
+            return
+        if tag in ('script', 'style'):
+            self.in_raw_text = False
+        if tag in RCDATA_ELEMENTS and self.in_rcdata:
+            # Also leaves cdata mode for a self-closed <textarea/>
+            self.clear_cdata_mode()
+            self.in_rcdata = False
+
+        # Close everything up to the matching tag; HTML often leaves elements unclosed
+        if not any(open_tag == tag for open_tag, _, _, _ in self.open_elements):
+            return
+        while self.close_element() != tag:
+            pass
+
+    def close_element(self):
+        open_tag, item, names, text_parts = self.open_elements.pop()
+        if text_parts is not None and self.items:
+            self.add_property(names, ' '.join(''.join(text_parts).split()))
+        if item is not None:
+            self.items.pop()
+        return open_tag
+
+    def add_json_ld(self, text):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return
+        for record in data if isinstance(data, list) else [data]:
+            if isinstance(record, dict) and isinstance(record.get('@graph'), list):
+                self.json_ld.extend(record['@graph'])
+            else:
+                self.json_ld.append(record)
+
+def extract_structured_data(html_content):
+    # Cheap alternative to CSS-selector extraction for pages that embed their data
+    data = {'json_ld': [], 'microdata': [], 'meta': {}}
+    lowered = html_content.lower()
+    if 'ld+json' not in lowered and 'itemscope' not in lowered and '<meta' not in lowered:
+        return data
+
+    parser = StructuredDataParser()
+    parser.feed(html_content)
+    parser.close()
+    data['json_ld'] = parser.json_ld
+    data['microdata'] = parser.microdata
+    data['meta'] = parser.meta
+    return data
+
+def normalize_url(url):
+    # One spelling per URL in the index: no fragment, lowercase scheme and host, "/" for an empty path
+    parts = urlsplit(urldefrag(url.strip())[0])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
+def collect_urls(soup, tag, attribute, base_url):
+    # Resolve against the final (post-redirect) URL, normalize and keep first-seen order
+    urls = {}
+    for element in soup.find_all(tag):
+        value = element.get(attribute)
+        if not value:
+            continue
+        url = normalize_url(urljoin(base_url, value.strip()))
+        if url.startswith(('http://', 'https://')):
+            urls[url] = None
+    return list(urls)
+
+def page_text(soup):
+    # Visible text only; note this removes script/style elements from the soup
+    for element in soup(['script', 'style', 'noscript', 'template']):
+        element.decompose()
+    return soup.get_text(' ', strip=True)
+
+def fts_query(query):
+    # Build FTS5 syntax ourselves so no user input reaches the query parser unescaped:
+    # every word is quoted, "balanced phrases" stay phrases and a trailing * keeps prefix matching
+    if query.count('"') % 2:
+        query = query.replace('"', ' ')
+    terms = []
+    for i, part in enumerate(query.split('"')):
+        if i % 2:
+            words = part.replace('*', ' ').split()
+            if words:
+                terms.append('"' + ' '.join(words) + '"')
+            continue
+        for word in part.split():
+            prefix = word.endswith('*')
+            word = word.replace('*', '')
+            if word:
+                terms.append('"' + word + '"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+# Link/image inventory and full-text index shared by all scraped pages, stored in SQLite.
+# Every URL is stored once in `urls`; `page_refs` holds (page, kind, target) id triples
+# with a reverse index so both "what does this page reference" and "who references X" are lookups.
+# `page_text` is an FTS5 table whose rowid is the page's url id.
+# Like the job queue it uses WAL mode, so the file must live on a local disk.
+class PageIndex:
+    LINK = 0
+    IMAGE = 1
+
+    def __init__(self, path="scraper_index.db"):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Indexes from before the prefix option are moved aside and copied into the new table below
+            old_text = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'page_text'").fetchone()
+            if old_text and "prefix" not in old_text[0]:
+                conn.execute("ALTER TABLE page_text RENAME TO page_text_old")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS urls (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    id INTEGER PRIMARY KEY REFERENCES urls (id),
+                    scraped_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS page_refs (
+                    page_id INTEGER NOT NULL,
+                    kind INTEGER NOT NULL,
+                    target_id INTEGER NOT NULL,
+                    PRIMARY KEY (page_id, kind, target_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS page_refs_target ON page_refs (target_id, kind, page_id);
+                CREATE TABLE IF NOT EXISTS ref_counts (
+                    kind INTEGER NOT NULL,
+                    target_id INTEGER NOT NULL,
+                    pages INTEGER NOT NULL,
+                    PRIMARY KEY (kind, target_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS ref_counts_pages ON ref_counts (kind, pages);
+                CREATE TABLE IF NOT EXISTS index_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5 (title, body, prefix='2 3');
+            """)
+            if old_text and "prefix" not in old_text[0]:
+                with conn:
+                    conn.execute("INSERT INTO page_text (rowid, title, body) SELECT rowid, title, body FROM page_text_old")
+                    conn.execute("DROP TABLE page_text_old")
+            # Indexes created before the counters existed get them computed once
+            if conn.execute("SELECT COUNT(*) FROM index_stats").fetchone()[0] == 0:
+                with conn:
+                    self._rebuild_counts(conn)
+
+    def _rebuild_counts(self, conn):
+        conn.execute("DELETE FROM ref_counts")
+        conn.execute("""
+            INSERT INTO ref_counts (kind, target_id, pages)
+            SELECT kind, target_id, COUNT(*) FROM page_refs GROUP BY kind, target_id
+        """)
+        conn.execute("DELETE FROM index_stats")
+        conn.execute("INSERT INTO index_stats (name, value) SELECT 'pages', COUNT(*) FROM pages")
+        conn.execute("INSERT INTO index_stats (name, value) SELECT 'links', COUNT(*) FROM page_refs WHERE kind = ?", (self.LINK,))
+        conn.execute("INSERT INTO index_stats (name, value) SELECT 'images', COUNT(*) FROM page_refs WHERE kind = ?", (self.IMAGE,))
+
+    def _connect(self):
+        # Connections are cheap and not shareable across QThreads, so open one per call
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _url_id(self, conn, url):
+        conn.execute("INSERT OR IGNORE INTO urls (url) VALUES (?)", (url,))
+        return conn.execute("SELECT id FROM urls WHERE url = ?", (url,)).fetchone()[0]
+
+    def add_page(self, page_url, links, images, title=None, text=None):
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with closing(self._connect()) as conn, conn:
+            page_id = self._url_id(conn, normalize_url(page_url))
+            new_page = conn.execute("SELECT 1 FROM pages WHERE id = ?", (page_id,)).fetchone() is None
+            conn.execute("INSERT OR REPLACE INTO pages (id, scraped_at) VALUES (?, ?)", (page_id, timestamp))
+
+            # A re-scrape replaces the page's previous inventory; the per-target counts and the
+            # totals are adjusted here so stats() and shared_images() never scan page_refs
+            old_refs = conn.execute("SELECT kind, target_id FROM page_refs WHERE page_id = ?", (page_id,)).fetchall()
+            conn.executemany("UPDATE ref_counts SET pages = pages - 1 WHERE kind = ? AND target_id = ?", old_refs)
+            conn.executemany("DELETE FROM ref_counts WHERE kind = ? AND target_id = ? AND pages <= 0", old_refs)
+            conn.execute("DELETE FROM page_refs WHERE page_id = ?", (page_id,))
+
+            refs = {(self.LINK, self._url_id(conn, url)) for url in links}
+            refs |= {(self.IMAGE, self._url_id(conn, url)) for url in images}
+            conn.executemany("INSERT INTO page_refs (page_id, kind, target_id) VALUES (?, ?, ?)",
+                             [(page_id, kind, target_id) for kind, target_id in refs])
+            conn.executemany("""
+                INSERT INTO ref_counts (kind, target_id, pages) VALUES (?, ?, 1)
+                ON CONFLICT (kind, target_id) DO UPDATE SET pages = pages + 1
+            """, refs)
+
+            changes = {"pages": int(new_page), "links": 0, "images": 0}
+            for kind, _ in old_refs:
+                changes["links" if kind == self.LINK else "images"] -= 1
+            for kind, _ in refs:
+                changes["links" if kind == self.LINK else "images"] += 1
+            conn.executemany("UPDATE index_stats SET value = value + ? WHERE name = ?",
+                             [(change, name) for name, change in changes.items()])
+            if text is not None:
+                conn.execute("DELETE FROM page_text WHERE rowid = ?", (page_id,))
+                conn.execute("INSERT INTO page_text (rowid, title, body) VALUES (?, ?, ?)",
+                             (page_id, title or '', text))
+
+    def search(self, query, limit=50):
+        # Best matches first (title hits weigh more than body hits), with a highlighted excerpt.
+        # Only rowids are ranked; the excerpt and url lookup run for the `limit` best rows alone
+        match = fts_query(query)
+        if not match:
+            return []
+        with closing(self._connect()) as conn:
+            return conn.execute("""
+                SELECT urls.url, page_text.title, snippet(page_text, 1, '[', ']', '...', 16)
+                FROM page_text
+                JOIN (
+                    SELECT rowid, bm25(page_text, 5.0, 1.0) AS score
+                    FROM page_text
+                    WHERE page_text MATCH ?1
+                    ORDER BY score
+                    LIMIT ?2
+                ) AS best ON best.rowid = page_text.rowid
+                JOIN urls ON urls.id = page_text.rowid
+                WHERE page_text MATCH ?1
+                ORDER BY best.score
+            """, (match, limit)).fetchall()
+
+    def referenced_by(self, target_url, kind=LINK):
+        # Pages that link to (or embed) the given URL
+        with closing(self._connect()) as conn:
+            rows = conn.execute("""
+                SELECT page.url FROM urls target
+                JOIN page_refs r ON r.target_id = target.id AND r.kind = ?
+                JOIN urls page ON page.id = r.page_id
+                WHERE target.url = ?
+                ORDER BY page.url
+            """, (kind, normalize_url(target_url))).fetchall()
+        return [row[0] for row in rows]
+
+    def references(self, page_url, kind=LINK):
+        # Links (or images) found on the given page
+        with closing(self._connect()) as conn:
+            rows = conn.execute("""
+                SELECT target.url FROM urls page
+                JOIN page_refs r ON r.page_id = page.id AND r.kind = ?
+                JOIN urls target ON target.id = r.target_id
+                WHERE page.url = ?
+                ORDER BY target.url
+            """, (kind, normalize_url(page_url))).fetchall()
+        return [row[0] for row in rows]
+
+    def shared_images(self, min_pages=2, limit=100):
+        # Images embedded by more than one page, most widely shared first
+        with closing(self._connect()) as conn:
+            return conn.execute("""
+                SELECT target.url, counts.pages FROM ref_counts counts
+                JOIN urls target ON target.id = counts.target_id
+                WHERE counts.kind = ? AND counts.pages >= ?
+                ORDER BY counts.pages DESC
+                LIMIT ?
+            """, (self.IMAGE, min_pages, limit)).fetchall()
+
+    def last_scraped(self, page_urls):
+        # {url: scraped_at} for the given URLs that have been scraped, in one query per call
+        keys = {normalize_url(url): url for url in page_urls}
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"""
+                SELECT urls.url, pages.scraped_at FROM urls JOIN pages ON pages.id = urls.id
+                WHERE urls.url IN ({placeholders})
+            """, list(keys)).fetchall()
+        return {keys[url]: datetime.datetime.strptime(scraped_at, "%Y-%m-%d %H:%M:%S") for url, scraped_at in rows}
+
+    def stats(self):
+        with closing(self._connect()) as conn:
+            totals = dict(conn.execute("SELECT name, value FROM index_stats").fetchall())
+        return totals.get("pages", 0), totals.get("links", 0), totals.get("images", 0)
+
+# Shared crawl job queue in SQLite. Any number of worker processes on this machine lease jobs,
+# and leases that expire without a result are handed to another worker until a job runs out
+# of attempts. The database runs in WAL mode, which SQLite only supports for processes on one
+# host with the file on a local disk, so workers on other machines or network shares are not supported.
+class JobQueue:
+    def __init__(self, path="scraper_jobs.db"):
+        self.path = path
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY,
+                    batch TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    selector TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    title TEXT,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires);
+                CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch, status);
+                CREATE INDEX IF NOT EXISTS jobs_batch_url ON jobs (batch, url);
+            """)
+
+    def _connect(self):
+        # Autocommit mode so claims can take the write lock up front with BEGIN IMMEDIATE
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def submit(self, urls, batch, selector=None):
+        # URLs already queued in the batch are skipped, so feeds listing a page twice queue it once
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN")
+            cursor = conn.executemany("""
+                INSERT INTO jobs (batch, url, selector, updated_at)
+                SELECT ?, ?, ?, ?
+                WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE batch = ? AND url = ?)
+            """, ((batch, url, selector or None, now, batch, url) for url in urls))
+            conn.execute("COMMIT")
+        return cursor.rowcount
+
+    def claim(self, worker, limit=1, lease_seconds=120, max_attempts=3):
+        # Atomically lease up to `limit` jobs: pending ones first, then ones whose lease expired
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                UPDATE jobs SET status = 'failed', error = 'lease expired', updated_at = ?
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """, (now, now, max_attempts))
+            jobs = conn.execute("""
+                SELECT id, url, selector FROM jobs
+                WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)
+                ORDER BY id
+                LIMIT ?
+            """, (now, limit)).fetchall()
+            conn.executemany("""
+                UPDATE jobs SET status = 'leased', worker = ?, lease_expires = ?,
+                                attempts = attempts + 1, updated_at = ?
+                WHERE id = ?
+            """, ((worker, now + lease_seconds, now, job[0]) for job in jobs))
+            conn.execute("COMMIT")
+        return jobs
+
+    def complete(self, job_id, worker, title, result=None):
+        # The first result wins, even if the lease was meanwhile handed to another worker;
+        # the job records which worker produced it
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                UPDATE jobs SET status = 'done', worker = ?, title = ?, result = ?, error = NULL, updated_at = ?
+                WHERE id = ? AND status != 'done'
+            """, (worker, title, result, time.time(), job_id))
+
+    def fail(self, job_id, worker, error, max_attempts=3):
+        # Only the current lease holder may give a job back; a worker whose lease expired
+        # must not requeue a job another worker is already processing
+        with closing(self._connect()) as conn:
+            conn.execute("""
+                UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                                error = ?, updated_at = ?
+                WHERE id = ? AND status = 'leased' AND worker = ?
+            """, (max_attempts, error, time.time(), job_id, worker))
+
+    def progress(self, batch=None):
+        # Job counts per status, for one batch or the whole queue
+        query = "SELECT status, COUNT(*) FROM jobs"
+        params = ()
+        if batch:
+            query += " WHERE batch = ?"
+            params = (batch,)
+        with closing(self._connect()) as conn:
+            counts = dict(conn.execute(query + " GROUP BY status", params).fetchall())
+        return {status: counts.get(status, 0) for status in ('pending', 'leased', 'done', 'failed')}
+
+    def active_workers(self, batch=None):
+        query = "SELECT worker, COUNT(*) FROM jobs WHERE status = 'leased' AND lease_expires >= ?"
+        params = (time.time(),)
+        if batch:
+            query += " AND batch = ?"
+            params += (batch,)
+        with closing(self._connect()) as conn:
+            return conn.execute(query + " GROUP BY worker ORDER BY worker", params).fetchall()
+
+    def results(self, batch, limit=None):
+        with closing(self._connect()) as conn:
+            return conn.execute("""
+                SELECT url, status, title, result, error FROM jobs
+                WHERE batch = ? AND status IN ('done', 'failed')
+                ORDER BY id
+                LIMIT ?
+            """, (batch, -1 if limit is None else limit)).fetchall()
+
+def run_worker(queue_path="scraper_jobs.db", index_path="scraper_index.db", worker=None,
+               timeout=30, user_agent=None, lease_seconds=120, exit_when_idle=False, poll_interval=2.0):
+    # Pull jobs until stopped (or until the queue is drained with exit_when_idle)
+    queue = JobQueue(queue_path)
+    page_index = PageIndex(index_path)
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    print(f"Worker {worker} started")
+
+    while True:
+        jobs = queue.claim(worker, lease_seconds=lease_seconds)
+        if not jobs:
+            if exit_when_idle:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        for job_id, url, selector in jobs:
+            try:
+                html_content, title = fetch_page(url, timeout, user_agent, page_index)
+                result = extract_elements(html_content, selector) if selector else None
+                queue.complete(job_id, worker, title, result)
+                print(f"[{worker}] done {url}")
+            except Exception as e:
+                queue.fail(job_id, worker, str(e))
+                print(f"[{worker}] failed {url}: {e}")
+
+    print(f"Worker {worker} finished: queue is empty")
+
+def worker_command(*options):
+    # A PyInstaller build is its own interpreter and takes the CLI arguments directly
+    if getattr(sys, "frozen", False):
+        return [sys.executable, "worker", *options]
+    return [sys.executable, os.path.abspath(__file__), "worker", *options]
+
+def start_workers(count, queue_path="scraper_jobs.db", index_path="scraper_index.db", **options):
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(queue_path, index_path), kwargs=options)
+        for _ in range(count)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+# On-disk state of a local batch run. The URL list is written once next to the checkpoint;
+# the checkpoint itself only records the next position, counters and how far the output
+# file had been written, so saving it stays cheap however long the batch is.
+class BatchCheckpoint:
+    def __init__(self, path="scraper_batch.json"):
+        self.path = path
+        self.urls_path = path + ".urls"
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def start(self, urls, output_path, selector=None, structured=False):
+        with open(self.urls_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(urls) + "\n")
+        state = {
+            "output": os.path.abspath(output_path),
+            "selector": selector or None,
+            "structured": structured,
+            "total": len(urls),
+            "position": 0,
+            "output_offset": 0,
+            "done": 0,
+            "failed": 0,
+        }
+        self.save(state)
+        return state
+
+    def load(self):
+        with open(self.path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def output_intact(self, state):
+        # Truncating a missing or shortened output file would pad it with NUL bytes
+        output_size = os.path.getsize(state["output"]) if os.path.exists(state["output"]) else 0
+        return output_size >= state["output_offset"]
+
+    def load_urls(self):
+        with open(self.urls_path, "r", encoding="utf-8") as file:
+            return [line.strip() for line in file if line.strip()]
+
+    def save(self, state):
+        # Write-then-rename so a crash mid-save leaves the previous checkpoint intact
+        state["saved_at"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        for path in (self.path, self.urls_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+def run_batch(checkpoint, timeout=30, user_agent=None, page_index=None,
+              progress=lambda done, total: None, should_stop=lambda: False,
+              checkpoint_every=50, checkpoint_seconds=10):
+    # Fetch (and optionally extract) every URL of the checkpointed batch, appending one JSON
+    # record per URL to the output file. Resumes from the last checkpoint; anything written
+    # after it is discarded and redone, so the output never holds duplicates.
+    state = checkpoint.load()
+    urls = checkpoint.load_urls()
+
+    if not checkpoint.output_intact(state):
+        raise ValueError(f"Output file {state['output']} is shorter than the checkpoint expects; cannot resume")
+
+    with open(state["output"], "ab") as output:
+        output.truncate(state["output_offset"])
+
+        # Progress as of the last fully written record, swapped in one assignment so an
+        # interrupt can never checkpoint a half-accounted URL
+        committed = {key: state[key] for key in ("position", "done", "failed", "output_offset")}
+
+        def save():
+            output.flush()
+            os.fsync(output.fileno())
+            state.update(committed)
+            checkpoint.save(state)
+
+        last_save = time.time()
+        saved_position = state["position"]
+        try:
+            for position in range(state["position"], len(urls)):
+                if should_stop():
+                    break
+
+                url = urls[position]
+                try:
+                    if state.get("structured") and not state["selector"]:
+                        # Structured data alone needs no parse tree (nor title or link index entry)
+                        html_content, _ = fetch_html(url, timeout, user_agent)
+                        record = {"url": url}
+                    else:
+                        html_content, title = fetch_page(url, timeout, user_agent, page_index)
+                        record = {"url": url, "title": title}
+                    if state["selector"]:
+                        record["result"] = extract_elements(html_content, state["selector"])
+                    if state.get("structured"):
+                        record["data"] = extract_structured_data(html_content)
+                except Exception as e:
+                    record = {"url": url, "error": str(e)}
+
+                output.write((json.dumps(record) + "\n").encode("utf-8"))
+                failed = "error" in record
+                committed = {
+                    "position": position + 1,
+                    "done": committed["done"] + (not failed),
+                    "failed": committed["failed"] + failed,
+                    "output_offset": output.tell(),
+                }
+                progress(committed["position"], len(urls))
+
+                if committed["position"] - saved_position >= checkpoint_every or time.time() - last_save >= checkpoint_seconds:
+                    save()
+                    last_save = time.time()
+                    saved_position = committed["position"]
+        finally:
+            # Also reached on Ctrl+C or an unexpected error, so finished URLs are never fetched again
+            save()
+
+    if state["position"] >= len(urls):
+        checkpoint.clear()
+    return state
+
+class BatchThread(QThread):
+    progress_signal = pyqtSignal(int)
+    result_signal = pyqtSignal(str)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, checkpoint, timeout=30, user_agent=None, page_index=None):
+        super().__init__()
+        self.checkpoint = checkpoint
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.page_index = page_index
+
+    def run(self):
+        try:
+            state = run_batch(
+                self.checkpoint, self.timeout, self.user_agent, self.page_index,
+                progress=lambda done, total: self.progress_signal.emit(int(done * 100 / total)),
+                should_stop=self.isInterruptionRequested
+            )
+            summary = f"{state['position']} of {state['total']} URLs processed "
+            summary += f"({state['done']} done, {state['failed']} failed)\n"
+            if state['position'] < state['total']:
+                summary += "Batch paused; it will resume from the checkpoint next time.\n"
+            summary += f"Output: {state['output']}"
+            self.result_signal.emit(summary)
+
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+def parse_feed_date(text):
+    # W3C datetime (sitemaps, Atom) or RFC 822 (RSS), returned as an aware UTC datetime
+    text = (text or '').strip()
+    if not text:
+        return None
+    try:
+        value = datetime.datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            value = email.utils.parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.astimezone(datetime.timezone.utc)
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def child_text(element, *names):
+    for child in element:
+        if local_name(child.tag) in names and child.text:
+            return child.text.strip()
+    return None
+
+def open_feed(source, timeout=30, user_agent=None):
+    # Byte stream over a URL or local file, transparently gunzipping .gz sitemaps
+    if source.startswith(('http://', 'https://')):
+        response = requests.get(source, headers={'User-Agent': user_agent or DEFAULT_USER_AGENT},
+                                timeout=timeout, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        stream = io.BufferedReader(response.raw)
+    else:
+        stream = open(source, 'rb')
+    if stream.peek(2)[:2] == b'\x1f\x8b':
+        return gzip.GzipFile(fileobj=stream), stream
+    return stream, stream
+
+def iter_feed_urls(source, since=None, timeout=30, user_agent=None, seen=None):
+    # Yield (url, lastmod) from a sitemap, sitemap index, RSS or Atom feed without holding the
+    # document in memory: each entry is dropped from the tree as soon as it has been read.
+    # Entries (and child sitemaps) last modified before `since` are skipped.
+    # `seen` holds the sitemaps already read, so indexes that list themselves or each other terminate.
+    seen = set() if seen is None else seen
+    if source in seen:
+        return
+    seen.add(source)
+    remote = source.startswith(('http://', 'https://'))
+
+    child_sitemaps = []
+    stream, raw = open_feed(source, timeout, user_agent)
+    try:
+        parents = []
+        for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                parents.append(element)
+                continue
+            parents.pop()
+
+            tag = local_name(element.tag)
+            if tag in ('url', 'sitemap'):
+                url = child_text(element, 'loc')
+                lastmod = parse_feed_date(child_text(element, 'lastmod'))
+            elif tag == 'item':
+                url = child_text(element, 'link')
+                lastmod = parse_feed_date(child_text(element, 'pubDate', 'date', 'updated'))
+            elif tag == 'entry':
+                url = None
+                for link in element:
+                    if local_name(link.tag) == 'link' and link.get('rel', 'alternate') == 'alternate':
+                        url = link.get('href')
+                        break
+                lastmod = parse_feed_date(child_text(element, 'updated', 'published'))
+            else:
+                continue
+
+            if parents:
+                parents[-1].remove(element)
+            if not url or (since and lastmod and lastmod < since):
+                continue
+            if tag == 'sitemap':
+                # A remote index must never make us open local files
+                if not remote or url.startswith(('http://', 'https://')):
+                    child_sitemaps.append(url)
+            else:
+                yield url, lastmod
+    finally:
+        stream.close()
+        raw.close()
+
+    # Sitemap indexes are small (50,000 entries at most), so children are read after the index is closed
+    for child in child_sitemaps:
+        yield from iter_feed_urls(child, since, timeout, user_agent, seen)
+
+def ingest_feed(source, queue, batch, since=None, page_index=None, selector=None, chunk_size=1000):
+    # Stream feed URLs into the job queue, skipping pages not modified since we last scraped them
+    submitted = skipped = 0
+    chunk = []
+
+    def flush():
+        scraped = {}
+        if page_index is not None:
+            scraped = page_index.last_scraped(url for url, lastmod in chunk if lastmod is not None)
+        urls = []
+        for url, lastmod in chunk:
+            if url in scraped and lastmod.astimezone().replace(tzinfo=None) <= scraped[url]:
+                continue
+            urls.append(url)
+        return (queue.submit(urls, batch, selector) if urls else 0), len(chunk) - len(urls)
+
+    for entry in iter_feed_urls(source, since):
+        chunk.append(entry)
+        if len(chunk) >= chunk_size:
+            queued, unchanged = flush()
+            submitted += queued
+            skipped += unchanged
+            chunk = []
+    if chunk:
+        queued, unchanged = flush()
+        submitted += queued
+        skipped += unchanged
+    return submitted, skipped
+
+class IngestThread(QThread):
+    result_signal = pyqtSignal(int, int)
+    error_signal = pyqtSignal(str)
+
+    def __init__(self, source, queue, batch, since=None, page_index=None, selector=None):
+        super().__init__()
+        self.source = source
+        self.queue = queue
+        self.batch = batch
+        self.since = since
+        self.page_index = page_index
+        self.selector = selector
+
+    def run(self):
+        try:
+            submitted, skipped = ingest_feed(self.source, self.queue, self.batch, self.since,
+                                             self.page_index, self.selector)
+            self.result_signal.emit(submitted, skipped)
+
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
 # Custom toggle switch for dark/light mode
 class ThemeSwitch(QCheckBox):
     def __init__(self, parent=None):
@@ -171,9 +1167,16 @@ class WebScraperApp(QMainWindow):
 
         # Store the HTML content
         self.html_content = None
+        self.scraped_url = None
         self.page_title = None
         self.history = []
         self.load_history()
+        self.page_index = PageIndex()
+        self.job_queue = JobQueue()
+        self.current_batch = None
+        self.worker_processes = []
+        self.batch_checkpoint = BatchCheckpoint()
+        self.batch_thread = None
 
         # Main widget and layout
         self.central_widget = QWidget()
@@ -191,6 +1194,15 @@ class WebScraperApp(QMainWindow):
         # Create history tab
         self.create_history_tab()
 
+        # Create link/image index tab
+        self.create_index_tab()
+
+        # Create full-text search tab
+        self.create_search_tab()
+
+        # Create distributed jobs tab
+        self.create_jobs_tab()
+
         # Create settings tab
         self.create_settings_tab()
 
@@ -206,6 +1218,9 @@ class WebScraperApp(QMainWindow):
         self.current_theme = "Light"
         self.change_theme("Light")
 
+        # Offer to pick up a local batch interrupted by a crash or shutdown
+        QTimer.singleShot(0, self.offer_batch_resume)
+
     def create_scraper_tab(self):
         scraper_tab = QWidget()
         scraper_layout = QVBoxLayout(scraper_tab)
@@ -273,6 +1288,14 @@ class WebScraperApp(QMainWindow):
 
         # Extraction options
         extraction_options = QHBoxLayout()
+        self.extract_mode_label = QLabel("Mode:")
+        self.extract_mode_selector = QComboBox()
+        self.extract_mode_selector.addItems(["CSS Selector", "Structured Data"])
+        self.extract_mode_selector.setToolTip("Structured Data reads JSON-LD, microdata and OpenGraph/meta fields without a selector")
+        self.extract_mode_selector.currentTextChanged.connect(self.change_extract_mode)
+
+        extraction_options.addWidget(self.extract_mode_label)
+        extraction_options.addWidget(self.extract_mode_selector)
         self.extract_text = QCheckBox("Text")
         self.extract_text.setChecked(True)
         self.extract_links = QCheckBox("Links")
@@ -362,6 +1385,161 @@ class WebScraperApp(QMainWindow):
         self.tab_widget.addTab(history_tab, "History")
         self.update_history_display()
 
+    def create_index_tab(self):
+        index_tab = QWidget()
+        index_layout = QVBoxLayout(index_tab)
+
+        query_layout = QHBoxLayout()
+        self.index_mode_selector = QComboBox()
+        self.index_mode_selector.addItems([
+            "Pages linking to URL", "Links on page", "Images on page",
+            "Pages using image", "Shared images"
+        ])
+        self.index_query_input = QLineEdit()
+        self.index_query_input.setPlaceholderText("Enter URL to look up in the link/image index")
+        self.index_query_input.setMinimumHeight(30)
+        self.index_query_input.returnPressed.connect(self.query_index)
+        self.index_query_button = QPushButton("Query")
+        self.index_query_button.setMinimumHeight(30)
+        self.index_query_button.clicked.connect(self.query_index)
+
+        query_layout.addWidget(self.index_mode_selector)
+        query_layout.addWidget(self.index_query_input)
+        query_layout.addWidget(self.index_query_button)
+
+        self.index_results = QTextEdit()
+        self.index_results.setReadOnly(True)
+        self.index_results.setFont(QFont("Consolas", 10))
+
+        index_layout.addLayout(query_layout)
+        index_layout.addWidget(self.index_results)
+
+        self.tab_widget.addTab(index_tab, "Link Index")
+
+    def create_search_tab(self):
+        search_tab = QWidget()
+        search_layout = QVBoxLayout(search_tab)
+
+        query_layout = QHBoxLayout()
+        self.search_label = QLabel("Search:")
+        self.search_label.setFont(QFont("Arial", 10))
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search the text of every scraped page (e.g., \"exact phrase\", pric*)")
+        self.search_input.setMinimumHeight(30)
+        self.search_input.returnPressed.connect(self.search_pages)
+        self.search_button = QPushButton("Search")
+        self.search_button.setMinimumHeight(30)
+        self.search_button.clicked.connect(self.search_pages)
+
+        query_layout.addWidget(self.search_label)
+        query_layout.addWidget(self.search_input)
+        query_layout.addWidget(self.search_button)
+
+        self.search_results = QTextEdit()
+        self.search_results.setReadOnly(True)
+        self.search_results.setFont(QFont("Consolas", 10))
+
+        search_layout.addLayout(query_layout)
+        search_layout.addWidget(self.search_results)
+
+        self.tab_widget.addTab(search_tab, "Search")
+
+    def create_jobs_tab(self):
+        jobs_tab = QWidget()
+        jobs_layout = QVBoxLayout(jobs_tab)
+
+        # Job submission
+        submit_group = QGroupBox("Submit Job")
+        submit_layout = QVBoxLayout()
+
+        self.job_urls_input = QTextEdit()
+        self.job_urls_input.setPlaceholderText("One URL per line")
+        self.job_urls_input.setMinimumHeight(120)
+        submit_layout.addWidget(self.job_urls_input)
+
+        job_options = QHBoxLayout()
+        self.job_selector_label = QLabel("CSS Selector (optional):")
+        self.job_selector_input = QLineEdit()
+        self.job_selector_input.setPlaceholderText("Extract with this selector on every page")
+        self.submit_job_button = QPushButton("Submit Job")
+        self.submit_job_button.clicked.connect(self.submit_job)
+
+        self.run_batch_button = QPushButton("Run Here")
+        self.run_batch_button.clicked.connect(self.run_local_batch)
+        self.stop_batch_button = QPushButton("Pause")
+        self.stop_batch_button.setEnabled(False)
+        self.stop_batch_button.clicked.connect(self.stop_local_batch)
+
+        job_options.addWidget(self.job_selector_label)
+        job_options.addWidget(self.job_selector_input)
+        job_options.addWidget(self.submit_job_button)
+        job_options.addWidget(self.run_batch_button)
+        job_options.addWidget(self.stop_batch_button)
+        submit_layout.addLayout(job_options)
+
+        # Bulk URL discovery from sitemaps and feeds
+        feed_options = QHBoxLayout()
+        self.feed_label = QLabel("Sitemap/Feed:")
+        self.feed_input = QLineEdit()
+        self.feed_input.setPlaceholderText("sitemap.xml, sitemap index, .xml.gz, RSS or Atom URL")
+        self.feed_since_label = QLabel("Changed since:")
+        self.feed_since_input = QLineEdit()
+        self.feed_since_input.setPlaceholderText("YYYY-MM-DD")
+        self.feed_since_input.setMaximumWidth(100)
+        self.import_feed_button = QPushButton("Import")
+        self.import_feed_button.clicked.connect(self.import_feed)
+
+        feed_options.addWidget(self.feed_label)
+        feed_options.addWidget(self.feed_input)
+        feed_options.addWidget(self.feed_since_label)
+        feed_options.addWidget(self.feed_since_input)
+        feed_options.addWidget(self.import_feed_button)
+        submit_layout.addLayout(feed_options)
+
+        submit_group.setLayout(submit_layout)
+        jobs_layout.addWidget(submit_group)
+
+        # Workers and progress
+        progress_group = QGroupBox("Progress")
+        progress_layout = QVBoxLayout()
+
+        worker_options = QHBoxLayout()
+        self.worker_count_label = QLabel("Local workers:")
+        self.worker_count_input = QLineEdit("4")
+        self.worker_count_input.setMaximumWidth(60)
+        self.start_workers_button = QPushButton("Start Workers")
+        self.start_workers_button.clicked.connect(self.start_local_workers)
+        self.show_job_results_button = QPushButton("Show Results")
+        self.show_job_results_button.clicked.connect(self.show_job_results)
+
+        worker_options.addWidget(self.worker_count_label)
+        worker_options.addWidget(self.worker_count_input)
+        worker_options.addWidget(self.start_workers_button)
+        worker_options.addWidget(self.show_job_results_button)
+        worker_options.addStretch()
+        progress_layout.addLayout(worker_options)
+
+        self.job_progress_bar = QProgressBar()
+        self.job_progress_bar.setValue(0)
+        self.job_progress_bar.setTextVisible(True)
+        progress_layout.addWidget(self.job_progress_bar)
+
+        self.job_status_text = QTextEdit()
+        self.job_status_text.setReadOnly(True)
+        self.job_status_text.setFont(QFont("Consolas", 10))
+        self.job_status_text.setText("No job submitted. Workers can also be started with: python main.py worker")
+        progress_layout.addWidget(self.job_status_text)
+
+        progress_group.setLayout(progress_layout)
+        jobs_layout.addWidget(progress_group)
+
+        # Poll the shared queue for aggregate progress
+        self.job_timer = QTimer(self)
+        self.job_timer.timeout.connect(self.update_job_progress)
+
+        self.jobs_tab = jobs_tab
+        self.tab_widget.addTab(jobs_tab, "Jobs")
+
     def create_settings_tab(self):
         settings_tab = QWidget()
         settings_layout = QVBoxLayout(settings_tab)
@@ -382,7 +1560,7 @@ class WebScraperApp(QMainWindow):
         # Default user agent
         user_agent_layout = QHBoxLayout()
         self.default_user_agent_label = QLabel("Default User-Agent:")
-        self.default_user_agent_input = QLineEdit("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        self.default_user_agent_input = QLineEdit(DEFAULT_USER_AGENT)
         user_agent_layout.addWidget(self.default_user_agent_label)
         user_agent_layout.addWidget(self.default_user_agent_input)
         general_layout.addLayout(user_agent_layout)
@@ -429,32 +1607,38 @@ class WebScraperApp(QMainWindow):
             url = 'https://' + url
             self.url_input.setText(url)
 
-        try:
-            timeout = int(self.timeout_input.text())
-        except ValueError:
-            self.status_bar.showMessage("Invalid timeout value, using default", 3000)
-            timeout = 30
-
-        user_agent = None
-        if self.user_agent_check.isChecked():
-            user_agent = self.user_agent_input.text()
+        timeout, user_agent = self.scrape_options()
 
         self.progress_bar.setValue(0)
         self.status_bar.showMessage("Scraping website...")
         self.scrape_button.setEnabled(False)
 
         # Create and start the scraper thread
-        self.scraper_thread = ScraperThread(url, timeout, user_agent)
+        self.scraper_thread = ScraperThread(url, timeout, user_agent, self.page_index)
         self.scraper_thread.progress_signal.connect(self.update_progress)
         self.scraper_thread.result_signal.connect(self.handle_scrape_result)
         self.scraper_thread.error_signal.connect(self.handle_scrape_error)
         self.scraper_thread.start()
 
+    def scrape_options(self):
+        # Timeout and User-Agent from the scraper tab, shared by everything that fetches pages
+        try:
+            timeout = int(self.timeout_input.text())
+        except ValueError:
+            self.status_bar.showMessage("Invalid timeout value, using default", 3000)
+            timeout = 30
+
+        user_agent = None
+        if self.user_agent_check.isChecked():
+            user_agent = self.user_agent_input.text()
+        return timeout, user_agent
+
     def update_progress(self, value):
         self.progress_bar.setValue(value)
 
     def handle_scrape_result(self, html_content, title):
         self.html_content = html_content
+        self.scraped_url = self.url_input.text()
         self.page_title = title
 
         self.results_area.setText(f"Website scraped successfully!\n\nPage title: {title}\n\nUse CSS selector to extract specific content.")
@@ -476,7 +1660,37 @@ class WebScraperApp(QMainWindow):
         self.results_area.setText(f"Error scraping website: {error_message}")
         self.scrape_button.setEnabled(True)
 
+    def change_extract_mode(self, mode):
+        selector_mode = mode == "CSS Selector"
+        self.selector_input.setEnabled(selector_mode)
+        for checkbox in (self.extract_text, self.extract_links, self.extract_images, self.extract_html):
+            checkbox.setEnabled(selector_mode)
+
     def extract_content(self):
+        if self.extract_mode_selector.currentText() == "Structured Data":
+            url = self.url_input.text().strip()
+            if not url:
+                self.status_bar.showMessage("Please enter a URL", 3000)
+                return
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+                self.url_input.setText(url)
+
+            # Structured data doesn't need a prior scrape; the page is fetched and scanned directly
+            html_content = self.html_content if url == self.scraped_url else None
+            timeout, user_agent = self.scrape_options()
+
+            self.progress_bar.setValue(0)
+            self.status_bar.showMessage("Extracting structured data...")
+            self.extract_button.setEnabled(False)
+
+            self.extractor_thread = StructuredDataThread(url, timeout, user_agent, html_content)
+            self.extractor_thread.progress_signal.connect(self.update_progress)
+            self.extractor_thread.result_signal.connect(self.handle_extract_result)
+            self.extractor_thread.error_signal.connect(self.handle_extract_error)
+            self.extractor_thread.start()
+            return
+
         if not self.html_content:
             self.status_bar.showMessage("Please scrape a website first", 3000)
             return
@@ -514,6 +1728,275 @@ class WebScraperApp(QMainWindow):
         self.results_area.setText(f"Error extracting content: {error_message}")
         self.extract_button.setEnabled(True)
 
+    def query_index(self):
+        mode = self.index_mode_selector.currentText()
+        url = self.index_query_input.text().strip()
+        if mode != "Shared images" and not url:
+            self.status_bar.showMessage("Please enter a URL", 3000)
+            return
+
+        try:
+            if mode == "Shared images":
+                rows = [f"{count} pages: {image}" for image, count in self.page_index.shared_images()]
+            elif mode == "Pages linking to URL":
+                rows = self.page_index.referenced_by(url, PageIndex.LINK)
+            elif mode == "Links on page":
+                rows = self.page_index.references(url, PageIndex.LINK)
+            elif mode == "Images on page":
+                rows = self.page_index.references(url, PageIndex.IMAGE)
+            else:
+                rows = self.page_index.referenced_by(url, PageIndex.IMAGE)
+        except sqlite3.Error as e:
+            self.status_bar.showMessage(f"Error querying index: {str(e)}", 5000)
+            return
+
+        pages, links, images = self.page_index.stats()
+        result = f"{mode}: {len(rows)} results\n"
+        result += f"(index covers {pages} pages, {links} links, {images} images)\n\n"
+        result += "\n".join(rows)
+        self.index_results.setText(result)
+
+    def search_pages(self):
+        query = self.search_input.text().strip()
+        if not query:
+            self.status_bar.showMessage("Please enter a search query", 3000)
+            return
+
+        try:
+            matches = self.page_index.search(query)
+        except sqlite3.Error as e:
+            self.status_bar.showMessage(f"Error searching pages: {str(e)}", 5000)
+            return
+
+        if not matches:
+            self.search_results.setText(f"No scraped pages match: {query}")
+            return
+
+        result = f"Found {len(matches)} pages matching '{query}':\n\n"
+        for i, (url, title, excerpt) in enumerate(matches, 1):
+            result += f"{i}. {title or 'No title'}\n   {url}\n   {excerpt}\n\n"
+        self.search_results.setText(result)
+
+    def job_urls(self):
+        urls = []
+        for line in self.job_urls_input.toPlainText().splitlines():
+            url = line.strip()
+            if not url:
+                continue
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            urls.append(url)
+        return urls
+
+    def submit_job(self):
+        urls = self.job_urls()
+        if not urls:
+            self.status_bar.showMessage("Please enter at least one URL", 3000)
+            return
+
+        batch = "job-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        try:
+            count = self.job_queue.submit(urls, batch, self.job_selector_input.text().strip())
+        except sqlite3.Error as e:
+            self.status_bar.showMessage(f"Error submitting job: {str(e)}", 5000)
+            return
+
+        self.current_batch = batch
+        self.job_progress_bar.setValue(0)
+        self.status_bar.showMessage(f"Submitted {count} URLs as {batch}", 3000)
+        self.update_job_progress()
+        self.job_timer.start(2000)
+
+    def import_feed(self):
+        source = self.feed_input.text().strip()
+        if not source:
+            self.status_bar.showMessage("Please enter a sitemap or feed URL", 3000)
+            return
+
+        since = None
+        if self.feed_since_input.text().strip():
+            since = parse_feed_date(self.feed_since_input.text())
+            if since is None:
+                self.status_bar.showMessage("Invalid date, use YYYY-MM-DD", 3000)
+                return
+
+        batch = "feed-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.status_bar.showMessage("Importing URLs...")
+        self.import_feed_button.setEnabled(False)
+
+        # Submitted URLs show up in the progress view as they are queued
+        self.current_batch = batch
+        self.job_timer.start(2000)
+
+        self.ingest_thread = IngestThread(source, self.job_queue, batch, since, self.page_index,
+                                          self.job_selector_input.text().strip())
+        self.ingest_thread.result_signal.connect(self.handle_import_result)
+        self.ingest_thread.error_signal.connect(self.handle_import_error)
+        self.ingest_thread.start()
+
+    def handle_import_result(self, submitted, skipped):
+        self.status_bar.showMessage(f"Queued {submitted} URLs, skipped {skipped} unchanged pages", 5000)
+        self.import_feed_button.setEnabled(True)
+        self.update_job_progress()
+
+    def handle_import_error(self, error_message):
+        self.status_bar.showMessage(f"Error: {error_message}", 5000)
+        self.job_status_text.setText(f"Error importing sitemap/feed: {error_message}")
+        self.import_feed_button.setEnabled(True)
+
+    def run_local_batch(self):
+        if self.batch_thread is not None and self.batch_thread.isRunning():
+            self.status_bar.showMessage("A batch is already running", 3000)
+            return
+
+        urls = self.job_urls()
+        if not urls:
+            self.status_bar.showMessage("Please enter at least one URL", 3000)
+            return
+
+        if self.batch_checkpoint.exists():
+            reply = QMessageBox.question(
+                self, "Run Batch",
+                "An unfinished batch exists. Discard it and start a new one?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Batch Output", "batch_results.jsonl", "JSON Lines (*.jsonl);;All Files (*)"
+        )
+        if not file_path:
+            return
+
+        try:
+            # Start from an empty output file; later resumes append to it
+            open(file_path, 'w').close()
+            self.batch_checkpoint.start(urls, file_path, self.job_selector_input.text().strip())
+        except OSError as e:
+            self.status_bar.showMessage(f"Error creating batch: {str(e)}", 5000)
+            return
+
+        self.start_batch_thread()
+
+    def offer_batch_resume(self):
+        if not self.batch_checkpoint.exists():
+            return
+
+        try:
+            state = self.batch_checkpoint.load()
+        except (OSError, ValueError):
+            return
+
+        if not self.batch_checkpoint.output_intact(state):
+            reply = QMessageBox.question(
+                self, "Resume Batch",
+                f"A batch was interrupted after {state['position']} of {state['total']} URLs, but its output "
+                f"file {state['output']} is missing or shorter than the checkpoint, so it can't be resumed. "
+                "Discard the checkpoint?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
+            if reply == QMessageBox.Yes:
+                self.batch_checkpoint.clear()
+            return
+
+        reply = QMessageBox.question(
+            self, "Resume Batch",
+            f"A batch was interrupted after {state['position']} of {state['total']} URLs "
+            f"(checkpoint saved {state.get('saved_at', 'unknown')}). Resume it now?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+        )
+        if reply == QMessageBox.Yes:
+            self.tab_widget.setCurrentWidget(self.jobs_tab)
+            self.start_batch_thread()
+
+    def start_batch_thread(self):
+        self.job_progress_bar.setValue(0)
+        self.job_status_text.setText("Running batch locally...")
+        self.status_bar.showMessage("Running batch...")
+        self.run_batch_button.setEnabled(False)
+        self.stop_batch_button.setEnabled(True)
+
+        timeout, user_agent = self.scrape_options()
+        self.batch_thread = BatchThread(self.batch_checkpoint, timeout, user_agent, self.page_index)
+        self.batch_thread.progress_signal.connect(self.job_progress_bar.setValue)
+        self.batch_thread.result_signal.connect(self.handle_batch_result)
+        self.batch_thread.error_signal.connect(self.handle_batch_error)
+        self.batch_thread.start()
+
+    def stop_local_batch(self):
+        if self.batch_thread is not None:
+            self.batch_thread.requestInterruption()
+            self.status_bar.showMessage("Pausing batch after the current URL...", 3000)
+
+    def handle_batch_result(self, summary):
+        self.job_status_text.setText(summary)
+        self.status_bar.showMessage("Batch stopped" if self.batch_checkpoint.exists() else "Batch finished", 3000)
+        self.run_batch_button.setEnabled(True)
+        self.stop_batch_button.setEnabled(False)
+
+    def handle_batch_error(self, error_message):
+        self.status_bar.showMessage(f"Error: {error_message}", 5000)
+        self.job_status_text.setText(f"Error running batch: {error_message}")
+        self.run_batch_button.setEnabled(True)
+        self.stop_batch_button.setEnabled(False)
+
+    def start_local_workers(self):
+        try:
+            count = int(self.worker_count_input.text())
+        except ValueError:
+            self.status_bar.showMessage("Invalid worker count", 3000)
+            return
+
+        # Workers run as separate processes so fetching and parsing scale past one interpreter
+        self.worker_processes = [process for process in self.worker_processes if process.poll() is None]
+        for _ in range(count):
+            self.worker_processes.append(subprocess.Popen(worker_command("--idle-exit")))
+        self.status_bar.showMessage(f"Started {count} local workers", 3000)
+
+    def update_job_progress(self):
+        if not self.current_batch:
+            return
+
+        try:
+            counts = self.job_queue.progress(self.current_batch)
+            workers = self.job_queue.active_workers(self.current_batch)
+        except sqlite3.Error as e:
+            self.status_bar.showMessage(f"Error reading job queue: {str(e)}", 5000)
+            return
+
+        total = sum(counts.values())
+        finished = counts['done'] + counts['failed']
+        self.job_progress_bar.setValue(int(finished * 100 / total) if total else 0)
+
+        status = f"{self.current_batch}: {finished} of {total} URLs finished\n\n"
+        status += f"Done: {counts['done']}   Failed: {counts['failed']}   "
+        status += f"In progress: {counts['leased']}   Pending: {counts['pending']}\n\n"
+        status += f"Active workers: {len(workers)}\n"
+        for worker, leased in workers:
+            status += f"  {worker}: {leased} jobs\n"
+        self.job_status_text.setText(status)
+
+        if total and finished == total:
+            self.job_timer.stop()
+            self.status_bar.showMessage(f"{self.current_batch} finished", 3000)
+
+    def show_job_results(self):
+        if not self.current_batch:
+            self.status_bar.showMessage("Please submit a job first", 3000)
+            return
+
+        result = f"Results for {self.current_batch}:\n\n"
+        for url, status, title, extracted, error in self.job_queue.results(self.current_batch):
+            if status == 'done':
+                result += f"{url} - {title}\n"
+                if extracted:
+                    result += extracted + "\n"
+            else:
+                result += f"{url} - failed: {error}\n"
+        self.results_area.setText(result)
+        self.tab_widget.setCurrentIndex(0)  # Switch to scraper tab
+
     def save_results(self):
         if not self.results_area.toPlainText():
             self.status_bar.showMessage("No results to save", 3000)
@@ -536,6 +2019,13 @@ class WebScraperApp(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_bar.showMessage("Results cleared", 2000)
 
+    def closeEvent(self, event):
+        # Let a running batch write its checkpoint before the window goes away
+        if self.batch_thread is not None and self.batch_thread.isRunning():
+            self.batch_thread.requestInterruption()
+            self.batch_thread.wait()
+        event.accept()
+
     def change_theme(self, theme_name):
         app = QApplication.instance()
         palette = QPalette()
@@ -565,6 +2055,14 @@ class WebScraperApp(QMainWindow):
             self.clear_history_button.setStyleSheet(button_style)
             self.load_url_button.setStyleSheet(button_style)
             self.save_settings_button.setStyleSheet(button_style)
+            self.index_query_button.setStyleSheet(button_style)
+            self.search_button.setStyleSheet(button_style)
+            self.submit_job_button.setStyleSheet(button_style)
+            self.start_workers_button.setStyleSheet(button_style)
+            self.show_job_results_button.setStyleSheet(button_style)
+            self.run_batch_button.setStyleSheet(button_style)
+            self.stop_batch_button.setStyleSheet(button_style)
+            self.import_feed_button.setStyleSheet(button_style)
 
             # Explicitly set text color for all text inputs
             text_input_style = "color: white; background-color: #30343A; border: 1px solid #555;"
@@ -574,11 +2072,21 @@ class WebScraperApp(QMainWindow):
             self.selector_input.setStyleSheet(text_input_style)
             self.default_timeout_input.setStyleSheet(text_input_style)
             self.default_user_agent_input.setStyleSheet(text_input_style)
+            self.index_query_input.setStyleSheet(text_input_style)
+            self.search_input.setStyleSheet(text_input_style)
+            self.job_selector_input.setStyleSheet(text_input_style)
+            self.worker_count_input.setStyleSheet(text_input_style)
+            self.feed_input.setStyleSheet(text_input_style)
+            self.feed_since_input.setStyleSheet(text_input_style)
 
             # Set text color for text areas
             text_area_style = "color: white; background-color: #30343A; border: 1px solid #555;"
             self.results_area.setStyleSheet(text_area_style)
             self.history_text.setStyleSheet(text_area_style)
+            self.index_results.setStyleSheet(text_area_style)
+            self.search_results.setStyleSheet(text_area_style)
+            self.job_urls_input.setStyleSheet(text_area_style)
+            self.job_status_text.setStyleSheet(text_area_style)
 
             # Set text color for labels
             label_style = "color: white;"
@@ -586,6 +2094,12 @@ class WebScraperApp(QMainWindow):
             self.timeout_label.setStyleSheet(label_style)
             self.selector_label.setStyleSheet(label_style)
             self.theme_label.setStyleSheet(label_style)
+            self.extract_mode_label.setStyleSheet(label_style)
+            self.search_label.setStyleSheet(label_style)
+            self.job_selector_label.setStyleSheet(label_style)
+            self.worker_count_label.setStyleSheet(label_style)
+            self.feed_label.setStyleSheet(label_style)
+            self.feed_since_label.setStyleSheet(label_style)
             self.default_timeout_label.setStyleSheet(label_style)
             self.default_user_agent_label.setStyleSheet(label_style)
             self.font_size_label.setStyleSheet(label_style)
@@ -601,6 +2115,8 @@ class WebScraperApp(QMainWindow):
             # Set style for combo boxes
             combobox_style = "color: white; background-color: #30343A; border: 1px solid #555; selection-background-color: #4B8BBE;"
             self.font_size_selector.setStyleSheet(combobox_style)
+            self.index_mode_selector.setStyleSheet(combobox_style)
+            self.extract_mode_selector.setStyleSheet(combobox_style)
 
             # Set style for group boxes
             groupbox_style = "QGroupBox { color: white; border: 1px solid #555; margin-top: 1.5ex; } QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; }"
@@ -610,6 +2126,7 @@ class WebScraperApp(QMainWindow):
             # Set style for progress bar
             progress_style = "QProgressBar { border: 1px solid #555; border-radius: 3px; text-align: center; color: white; } QProgressBar::chunk { background-color: #4B8BBE; }"
             self.progress_bar.setStyleSheet(progress_style)
+            self.job_progress_bar.setStyleSheet(progress_style)
 
             # Fix tab widget styling
             tab_style = """
@@ -661,6 +2178,14 @@ class WebScraperApp(QMainWindow):
             self.clear_history_button.setStyleSheet(normal_button_style)
             self.load_url_button.setStyleSheet(normal_button_style)
             self.save_settings_button.setStyleSheet(normal_button_style)
+            self.index_query_button.setStyleSheet(normal_button_style)
+            self.search_button.setStyleSheet(normal_button_style)
+            self.submit_job_button.setStyleSheet(normal_button_style)
+            self.start_workers_button.setStyleSheet(normal_button_style)
+            self.show_job_results_button.setStyleSheet(normal_button_style)
+            self.run_batch_button.setStyleSheet(normal_button_style)
+            self.stop_batch_button.setStyleSheet(normal_button_style)
+            self.import_feed_button.setStyleSheet(normal_button_style)
 
             # Explicitly set text color for all text inputs
             text_input_style = "color: black; background-color: white; border: 1px solid #CCC;"
@@ -670,11 +2195,21 @@ class WebScraperApp(QMainWindow):
             self.selector_input.setStyleSheet(text_input_style)
             self.default_timeout_input.setStyleSheet(text_input_style)
             self.default_user_agent_input.setStyleSheet(text_input_style)
+            self.index_query_input.setStyleSheet(text_input_style)
+            self.search_input.setStyleSheet(text_input_style)
+            self.job_selector_input.setStyleSheet(text_input_style)
+            self.worker_count_input.setStyleSheet(text_input_style)
+            self.feed_input.setStyleSheet(text_input_style)
+            self.feed_since_input.setStyleSheet(text_input_style)
 
             # Set text color for text areas
             text_area_style = "color: black; background-color: white; border: 1px solid #CCC;"
             self.results_area.setStyleSheet(text_area_style)
             self.history_text.setStyleSheet(text_area_style)
+            self.index_results.setStyleSheet(text_area_style)
+            self.search_results.setStyleSheet(text_area_style)
+            self.job_urls_input.setStyleSheet(text_area_style)
+            self.job_status_text.setStyleSheet(text_area_style)
 
             # Set text color for labels
             label_style = "color: black;"
@@ -682,6 +2217,12 @@ class WebScraperApp(QMainWindow):
             self.timeout_label.setStyleSheet(label_style)
             self.selector_label.setStyleSheet(label_style)
             self.theme_label.setStyleSheet(label_style)
+            self.extract_mode_label.setStyleSheet(label_style)
+            self.search_label.setStyleSheet(label_style)
+            self.job_selector_label.setStyleSheet(label_style)
+            self.worker_count_label.setStyleSheet(label_style)
+            self.feed_label.setStyleSheet(label_style)
+            self.feed_since_label.setStyleSheet(label_style)
             self.default_timeout_label.setStyleSheet(label_style)
             self.default_user_agent_label.setStyleSheet(label_style)
             self.font_size_label.setStyleSheet(label_style)
@@ -697,6 +2238,8 @@ class WebScraperApp(QMainWindow):
             # Set style for combo boxes
             combobox_style = "color: black; background-color: white; border: 1px solid #CCC;"
             self.font_size_selector.setStyleSheet(combobox_style)
+            self.index_mode_selector.setStyleSheet(combobox_style)
+            self.extract_mode_selector.setStyleSheet(combobox_style)
 
             # Set style for group boxes
             groupbox_style = "QGroupBox { color: black; border: 1px solid #CCC; margin-top: 1.5ex; } QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; }"
@@ -706,6 +2249,7 @@ class WebScraperApp(QMainWindow):
             # Set style for progress bar
             progress_style = "QProgressBar { border: 1px solid #CCC; border-radius: 3px; text-align: center; color: black; } QProgressBar::chunk { background-color: #2A82DA; }"
             self.progress_bar.setStyleSheet(progress_style)
+            self.job_progress_bar.setStyleSheet(progress_style)
 
             # Fix tab widget styling
             tab_style = """
@@ -744,6 +2288,9 @@ class WebScraperApp(QMainWindow):
         font = QFont("Consolas", int(size))
         self.results_area.setFont(font)
         self.history_text.setFont(font)
+        self.index_results.setFont(font)
+        self.search_results.setFont(font)
+        self.job_status_text.setFont(font)
 
     def save_settings(self):
         QMessageBox.information(self, "Settings", "Settings saved successfully!")
@@ -794,7 +2341,155 @@ class WebScraperApp(QMainWindow):
             self.tab_widget.setCurrentIndex(0)  # Switch to scraper tab
             self.status_bar.showMessage("URL loaded from history", 2000)
 
+def run_cli(argv):
+    parser = argparse.ArgumentParser(prog="main.py", description="Web Scraper Pro command line")
+    parser.add_argument("--index", default="scraper_index.db", help="path to the page index database (local disk only)")
+    parser.add_argument("--queue", default="scraper_jobs.db", help="path to the job queue database (local disk only)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    links_to = commands.add_parser("links-to", help="list pages that link to (or embed) a URL")
+    links_to.add_argument("url")
+    links_to.add_argument("--images", action="store_true", help="look up pages embedding an image URL")
+
+    links_from = commands.add_parser("links-from", help="list links (or images) found on a scraped page")
+    links_from.add_argument("url")
+    links_from.add_argument("--images", action="store_true", help="list images instead of links")
+
+    shared = commands.add_parser("shared-images", help="list images used by several pages")
+    shared.add_argument("--min-pages", type=int, default=2)
+    shared.add_argument("--limit", type=int, default=100)
+
+    search = commands.add_parser("search", help="full-text search over every scraped page")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=20)
+
+    structured = commands.add_parser("structured", help="print JSON-LD, microdata and OpenGraph/meta fields of a page")
+    structured.add_argument("url")
+    structured.add_argument("--timeout", type=int, default=30)
+
+    submit = commands.add_parser("submit", help="add URLs to the shared job queue")
+    submit.add_argument("urls", nargs="*")
+    submit.add_argument("--file", help="read URLs from a file, one per line")
+    submit.add_argument("--batch", help="batch name (default: timestamp)")
+    submit.add_argument("--selector", help="CSS selector to extract on every page")
+
+    ingest = commands.add_parser("ingest", help="queue every URL of a sitemap, sitemap index, RSS or Atom feed")
+    ingest.add_argument("source", help="URL or local path (.xml or .xml.gz)")
+    ingest.add_argument("--since", help="skip entries last modified before this date (YYYY-MM-DD)")
+    ingest.add_argument("--all", action="store_true", help="also queue pages unchanged since they were last scraped")
+    ingest.add_argument("--batch", help="batch name (default: timestamp)")
+    ingest.add_argument("--selector", help="CSS selector to extract on every page")
+
+    worker = commands.add_parser("worker", help="fetch and extract jobs from the queue on this machine")
+    worker.add_argument("--processes", type=int, default=1, help="number of local worker processes to run")
+    worker.add_argument("--id", help="worker name (default: host-pid)")
+    worker.add_argument("--timeout", type=int, default=30)
+    worker.add_argument("--lease", type=int, default=120, help="seconds before an unfinished job is reassigned")
+    worker.add_argument("--idle-exit", action="store_true", help="exit once the queue is empty")
+
+    batch = commands.add_parser("batch", help="run a batch locally with resumable checkpoints")
+    batch.add_argument("--file", help="URLs to fetch, one per line (omit to resume the checkpointed batch)")
+    batch.add_argument("--output", default="batch_results.jsonl", help="JSON Lines file receiving one record per URL")
+    batch.add_argument("--selector", help="CSS selector to extract on every page")
+    batch.add_argument("--structured", action="store_true", help="add JSON-LD, microdata and meta fields to each record")
+    batch.add_argument("--checkpoint", default="scraper_batch.json")
+    batch.add_argument("--timeout", type=int, default=30)
+    batch.add_argument("--every", type=int, default=50, help="checkpoint after this many URLs")
+
+    progress = commands.add_parser("progress", help="show job queue progress")
+    progress.add_argument("--batch")
+
+    args = parser.parse_args(argv)
+    page_index = PageIndex(args.index)
+    kind = PageIndex.IMAGE if getattr(args, "images", False) else PageIndex.LINK
+
+    if args.command == "links-to":
+        for url in page_index.referenced_by(args.url, kind):
+            print(url)
+    elif args.command == "links-from":
+        for url in page_index.references(args.url, kind):
+            print(url)
+    elif args.command == "shared-images":
+        for image, count in page_index.shared_images(args.min_pages, args.limit):
+            print(f"{count}\t{image}")
+    elif args.command == "search":
+        try:
+            matches = page_index.search(args.query, args.limit)
+        except sqlite3.Error as e:
+            print(f"Error searching pages: {e}")
+            return 1
+        for url, title, excerpt in matches:
+            print(f"{url}\t{title}\n    {excerpt}")
+    elif args.command == "structured":
+        # Fast path: decode and scan the page without building a parse tree
+        html_content, _ = fetch_html(args.url, args.timeout)
+        print(json.dumps(extract_structured_data(html_content), indent=2, ensure_ascii=False))
+    elif args.command == "submit":
+        urls = list(args.urls)
+        if args.file:
+            with open(args.file, "r", encoding="utf-8") as file:
+                urls += [line.strip() for line in file if line.strip()]
+        batch = args.batch or "job-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        count = JobQueue(args.queue).submit(urls, batch, args.selector)
+        print(f"Submitted {count} URLs as {batch}")
+    elif args.command == "ingest":
+        since = parse_feed_date(args.since) if args.since else None
+        if args.since and since is None:
+            print(f"Invalid date: {args.since}")
+            return 1
+        batch = args.batch or "feed-" + datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        submitted, skipped = ingest_feed(args.source, JobQueue(args.queue), batch, since,
+                                         None if args.all else PageIndex(args.index), args.selector)
+        print(f"Submitted {submitted} URLs as {batch}, skipped {skipped} unchanged pages")
+    elif args.command == "worker":
+        if args.processes > 1:
+            start_workers(args.processes, args.queue, args.index, timeout=args.timeout,
+                          lease_seconds=args.lease, exit_when_idle=args.idle_exit)
+        else:
+            run_worker(args.queue, args.index, args.id, args.timeout,
+                       lease_seconds=args.lease, exit_when_idle=args.idle_exit)
+    elif args.command == "batch":
+        checkpoint = BatchCheckpoint(args.checkpoint)
+        if args.file:
+            if checkpoint.exists():
+                print(f"Discarding unfinished batch in {args.checkpoint}")
+            with open(args.file, "r", encoding="utf-8") as file:
+                urls = [line.strip() for line in file if line.strip()]
+            open(args.output, "w").close()
+            checkpoint.start(urls, args.output, args.selector, args.structured)
+        elif not checkpoint.exists():
+            print(f"No batch to resume in {args.checkpoint}; pass --file to start one")
+            return 1
+        else:
+            state = checkpoint.load()
+            print(f"Resuming after {state['position']} of {state['total']} URLs")
+
+        def report(done, total):
+            print(f"\r{done}/{total}", end="", flush=True)
+
+        try:
+            state = run_batch(checkpoint, args.timeout, page_index=PageIndex(args.index),
+                              progress=report, checkpoint_every=args.every)
+        except KeyboardInterrupt:
+            print("\nInterrupted; rerun without --file to resume")
+            return 1
+        except ValueError as e:
+            print(e)
+            return 1
+        print(f"\n{state['done']} done, {state['failed']} failed, output in {state['output']}")
+    elif args.command == "progress":
+        counts = JobQueue(args.queue).progress(args.batch)
+        print("  ".join(f"{status}: {count}" for status, count in counts.items()))
+    return 0
+
 if __name__ == "__main__":
+    # Worker processes of a frozen build re-run the executable; let multiprocessing take them over
+    multiprocessing.freeze_support()
+
+    # Any arguments select the command line interface, otherwise start the GUI
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+
     app = QApplication(sys.argv)
     window = WebScraperApp()
     window.show()
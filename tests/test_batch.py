@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+main = pytest.importorskip("main")
+
+URLS = [f"https://site.test/{i}" for i in range(5)]
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    calls = []
+
+    def fetch_page(url, timeout=30, user_agent=None, page_index=None, progress=None):
+        calls.append(url)
+        if url.endswith("/3") and calls.count(url) == 1:
+            raise KeyboardInterrupt
+        if url.endswith("/4"):
+            raise ValueError("404 Client Error")
+        return "<html></html>", "Page " + url[-1]
+
+    monkeypatch.setattr(main, "fetch_page", fetch_page)
+    return calls
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_resume_after_interrupt_skips_finished_urls(tmp_path, fetched):
+    output = tmp_path / "out.jsonl"
+    output.write_text("")
+    checkpoint = main.BatchCheckpoint(str(tmp_path / "batch.json"))
+    checkpoint.start(URLS, str(output))
+
+    with pytest.raises(KeyboardInterrupt):
+        main.run_batch(checkpoint, checkpoint_every=100)
+    state = checkpoint.load()
+    assert (state["position"], state["done"], state["failed"]) == (3, 3, 0)
+
+    # A record written after the last checkpoint is discarded on resume
+    with open(output, "a", encoding="utf-8") as file:
+        file.write('{"url": "partial')
+
+    state = main.run_batch(checkpoint)
+    assert (state["position"], state["done"], state["failed"]) == (5, 4, 1)
+    assert fetched == URLS[:4] + URLS[3:]
+    assert [record["url"] for record in read_records(output)] == URLS
+    assert read_records(output)[4] == {"url": URLS[4], "error": "404 Client Error"}
+    assert not checkpoint.exists()
+
+
+def test_should_stop_pauses_and_keeps_checkpoint(tmp_path, fetched):
+    output = tmp_path / "out.jsonl"
+    output.write_text("")
+    checkpoint = main.BatchCheckpoint(str(tmp_path / "batch.json"))
+    checkpoint.start(URLS[:3], str(output))
+
+    state = main.run_batch(checkpoint, should_stop=lambda: len(fetched) == 2)
+    assert state["position"] == 2
+    assert checkpoint.load()["output_offset"] == output.stat().st_size
+
+
+def test_resume_refuses_shortened_output(tmp_path, fetched):
+    output = tmp_path / "out.jsonl"
+    output.write_text("")
+    checkpoint = main.BatchCheckpoint(str(tmp_path / "batch.json"))
+    checkpoint.start(URLS[:2], str(output))
+    main.run_batch(checkpoint, should_stop=lambda: len(fetched) == 1)
+
+    output.unlink()
+    assert not checkpoint.output_intact(checkpoint.load())
+    with pytest.raises(ValueError):
+        main.run_batch(checkpoint)
+
+
+def test_structured_batch_without_selector_skips_the_parse_tree(tmp_path, monkeypatch):
+    html = '<script type="application/ld+json">{"@type": "Product"}</script>'
+    monkeypatch.setattr(main, "fetch_html", lambda url, timeout=30, user_agent=None: (html, url))
+    monkeypatch.setattr(main, "fetch_page", lambda *args, **kwargs: pytest.fail("parse tree built"))
+    output = tmp_path / "out.jsonl"
+    output.write_text("")
+    checkpoint = main.BatchCheckpoint(str(tmp_path / "batch.json"))
+    checkpoint.start(URLS[:1], str(output), structured=True)
+
+    main.run_batch(checkpoint)
+    assert read_records(output) == [
+        {"url": URLS[0], "data": {"json_ld": [{"@type": "Product"}], "microdata": [], "meta": {}}}
+    ]
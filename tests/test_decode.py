@@ -0,0 +1,48 @@
+import codecs
+
+import pytest
+
+main = pytest.importorskip("main")
+
+
+def test_bom_wins_over_header():
+    content = codecs.BOM_UTF8 + "café".encode("utf-8")
+    assert main.decode_html(content, "text/html; charset=iso-8859-2") == ("café", "utf-8-sig")
+
+
+def test_header_charset():
+    text, encoding = main.decode_html("żółw".encode("iso-8859-2"), 'text/html; charset="ISO-8859-2"')
+    assert (text, encoding) == ("żółw", "iso8859-2")
+
+
+def test_meta_charset_in_first_kilobyte():
+    content = b'<meta charset="windows-1251"><p>' + "привет".encode("cp1251")
+    text, encoding = main.decode_html(content)
+    assert encoding == "cp1251"
+    assert "привет" in text
+
+
+def test_meta_charset_after_first_kilobyte_is_ignored(monkeypatch):
+    monkeypatch.setattr(main, "detect_charset", None)
+    content = b" " * main.SNIFF_BYTES + b'<meta charset="koi8-r">' + "é".encode("utf-8")
+    assert main.decode_html(content)[1] == "utf-8"
+
+
+def test_latin1_and_ascii_labels_decode_as_windows_1252():
+    content = b"\x93quoted\x94"
+    assert main.decode_html(content, "text/html; charset=iso-8859-1") == ("“quoted”", "cp1252")
+    assert main.decode_html(content, "text/html; charset=us-ascii") == ("“quoted”", "cp1252")
+
+
+def test_utf16_meta_in_ascii_page_means_utf8():
+    content = b'<meta charset="utf-16">' + "ñ".encode("utf-8")
+    assert main.decode_html(content) == ('<meta charset="utf-16">ñ', "utf-8")
+
+
+def test_undeclared_utf8():
+    assert main.decode_html("naïve".encode("utf-8")) == ("naïve", "utf-8")
+
+
+def test_undeclared_legacy_bytes_fall_back_to_windows_1252(monkeypatch):
+    monkeypatch.setattr(main, "detect_charset", None)
+    assert main.decode_html(b"caf\xe9") == ("café", "cp1252")
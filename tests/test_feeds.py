@@ -0,0 +1,106 @@
+import datetime
+import gzip
+import io
+
+import pytest
+
+main = pytest.importorskip("main")
+
+UTC = datetime.timezone.utc
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://site.test/old</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>https://site.test/new</loc><lastmod>2025-06-01T12:00:00Z</lastmod></url>
+  <url><loc>https://site.test/undated</loc></url>
+</urlset>"""
+
+RSS = b"""<rss version="2.0"><channel><title>Blog</title>
+  <item><title>Post</title><link>https://blog.test/post</link><pubDate>Sun, 01 Jun 2025 10:00:00 +0200</pubDate></item>
+</channel></rss>"""
+
+ATOM = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <link rel="edit" href="https://blog.test/edit/1"/>
+    <link href="https://blog.test/1"/>
+    <updated>2025-06-01T00:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+def test_sitemap_entries_and_since_filter(tmp_path):
+    path = tmp_path / "sitemap.xml"
+    path.write_bytes(SITEMAP)
+
+    assert list(main.iter_feed_urls(str(path))) == [
+        ("https://site.test/old", datetime.datetime(2024, 1, 1, tzinfo=UTC)),
+        ("https://site.test/new", datetime.datetime(2025, 6, 1, 12, tzinfo=UTC)),
+        ("https://site.test/undated", None),
+    ]
+    since = datetime.datetime(2025, 1, 1, tzinfo=UTC)
+    assert [url for url, _ in main.iter_feed_urls(str(path), since)] == [
+        "https://site.test/new", "https://site.test/undated",
+    ]
+
+
+def test_rss_and_atom(tmp_path):
+    (tmp_path / "feed.rss").write_bytes(RSS)
+    (tmp_path / "feed.atom").write_bytes(ATOM)
+
+    assert list(main.iter_feed_urls(str(tmp_path / "feed.rss"))) == [
+        ("https://blog.test/post", datetime.datetime(2025, 6, 1, 8, tzinfo=UTC)),
+    ]
+    assert list(main.iter_feed_urls(str(tmp_path / "feed.atom"))) == [
+        ("https://blog.test/1", datetime.datetime(2025, 6, 1, tzinfo=UTC)),
+    ]
+
+
+def test_gzipped_index_that_lists_itself_terminates(tmp_path):
+    child = tmp_path / "child.xml.gz"
+    child.write_bytes(gzip.compress(SITEMAP))
+    index = tmp_path / "index.xml"
+    index.write_text(f"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+      <sitemap><loc>{index}</loc></sitemap>
+      <sitemap><loc>{child}</loc></sitemap>
+      <sitemap><loc>{child}</loc></sitemap>
+    </sitemapindex>""")
+
+    assert [url for url, _ in main.iter_feed_urls(str(index))] == [
+        "https://site.test/old", "https://site.test/new", "https://site.test/undated",
+    ]
+
+
+def test_remote_index_never_opens_local_files(monkeypatch, tmp_path):
+    local = tmp_path / "sitemap.xml"
+    local.write_bytes(SITEMAP)
+    documents = {
+        "https://site.test/index.xml": f"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+          <sitemap><loc>{local}</loc></sitemap>
+          <sitemap><loc>file://{local}</loc></sitemap>
+          <sitemap><loc>https://site.test/posts.xml</loc></sitemap>
+        </sitemapindex>""".encode(),
+        "https://site.test/posts.xml": RSS,
+    }
+    opened = []
+
+    def open_feed(source, timeout=30, user_agent=None):
+        opened.append(source)
+        stream = io.BufferedReader(io.BytesIO(documents[source]))
+        return stream, stream
+
+    monkeypatch.setattr(main, "open_feed", open_feed)
+    assert [url for url, _ in main.iter_feed_urls("https://site.test/index.xml")] == ["https://blog.test/post"]
+    assert opened == ["https://site.test/index.xml", "https://site.test/posts.xml"]
+
+
+def test_ingest_skips_pages_scraped_after_their_lastmod(tmp_path):
+    path = tmp_path / "sitemap.xml"
+    path.write_bytes(SITEMAP)
+    index = main.PageIndex(str(tmp_path / "index.db"))
+    index.add_page("https://site.test/old", [], [])
+    queue = main.JobQueue(str(tmp_path / "jobs.db"))
+
+    assert main.ingest_feed(str(path), queue, "feed", page_index=index, chunk_size=2) == (2, 1)
+    assert [url for _, url, _ in queue.claim("w", limit=10)] == [
+        "https://site.test/new", "https://site.test/undated",
+    ]
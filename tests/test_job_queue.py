@@ -0,0 +1,67 @@
+import pytest
+
+main = pytest.importorskip("main")
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return main.JobQueue(str(tmp_path / "jobs.db"))
+
+
+def test_submit_skips_urls_already_in_the_batch(queue):
+    assert queue.submit(["https://a.test/", "https://b.test/", "https://a.test/"], "batch") == 2
+    assert queue.submit(["https://a.test/"], "batch") == 0
+    assert queue.submit(["https://a.test/"], "other") == 1
+
+
+def test_claim_leases_each_job_once(queue):
+    queue.submit(["https://a.test/", "https://b.test/", "https://c.test/"], "batch", "h1")
+
+    first = queue.claim("w1", limit=2)
+    second = queue.claim("w2", limit=2)
+    assert first == [(1, "https://a.test/", "h1"), (2, "https://b.test/", "h1")]
+    assert second == [(3, "https://c.test/", "h1")]
+    assert queue.claim("w3") == []
+    assert queue.progress("batch") == {"pending": 0, "leased": 3, "done": 0, "failed": 0}
+    assert queue.active_workers("batch") == [("w1", 2), ("w2", 1)]
+
+
+def test_expired_lease_is_reclaimed_until_attempts_run_out(queue):
+    queue.submit(["https://a.test/"], "batch")
+
+    assert len(queue.claim("w1", lease_seconds=-1, max_attempts=2)) == 1
+    assert len(queue.claim("w2", lease_seconds=-1, max_attempts=2)) == 1
+    assert queue.claim("w3", max_attempts=2) == []
+    assert queue.results("batch") == [("https://a.test/", "failed", None, None, "lease expired")]
+
+
+def test_complete_records_result_and_first_result_wins(queue):
+    queue.submit(["https://a.test/"], "batch")
+    job_id = queue.claim("w1")[0][0]
+
+    queue.complete(job_id, "w1", "Title", '["x"]')
+    queue.complete(job_id, "w2", "Other", None)
+    assert queue.results("batch") == [("https://a.test/", "done", "Title", '["x"]', None)]
+    assert queue.progress() == {"pending": 0, "leased": 0, "done": 1, "failed": 0}
+
+
+def test_fail_requeues_until_max_attempts(queue):
+    queue.submit(["https://a.test/"], "batch")
+
+    job_id = queue.claim("w1")[0][0]
+    queue.fail(job_id, "w1", "timeout", max_attempts=2)
+    assert queue.progress("batch")["pending"] == 1
+
+    assert queue.claim("w1")[0][0] == job_id
+    queue.fail(job_id, "w1", "timeout again", max_attempts=2)
+    assert queue.results("batch") == [("https://a.test/", "failed", None, None, "timeout again")]
+
+
+def test_fail_ignores_workers_that_lost_the_lease(queue):
+    queue.submit(["https://a.test/"], "batch")
+    job_id = queue.claim("w1", lease_seconds=-1)[0][0]
+    assert queue.claim("w2")[0][0] == job_id
+
+    queue.fail(job_id, "w1", "stale worker")
+    assert queue.progress("batch")["leased"] == 1
+    assert queue.active_workers() == [("w2", 1)]
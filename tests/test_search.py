@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+
+main = pytest.importorskip("main")
+
+
+def test_fts_query_quotes_every_word():
+    assert main.fts_query("python scraping") == '"python" "scraping"'
+
+
+def test_fts_query_neutralises_operators():
+    assert main.fts_query("title: NOT (a OR b) NEAR") == '"title:" "NOT" "(a" "OR" "b)" "NEAR"'
+
+
+def test_fts_query_keeps_balanced_phrases_and_prefixes():
+    assert main.fts_query('"web scraper" pyth*') == '"web scraper" "pyth"*'
+    assert main.fts_query('"unbalanced phrase') == '"unbalanced" "phrase"'
+    assert main.fts_query('a*b ** "x*"') == '"ab" "x"'
+
+
+def test_fts_query_empty():
+    assert main.fts_query('  * " " ') == ''
+
+
+def test_search_ranks_title_hits_and_matches_prefixes(tmp_path):
+    index = main.PageIndex(str(tmp_path / "index.db"))
+    index.add_page("https://a.test/", [], [], "Cooking", "a page that mentions python once")
+    index.add_page("https://b.test/", [], [], "Python tutorial", "learn python here")
+    index.add_page("https://c.test/", [], [], "Gardening", "nothing relevant")
+
+    results = index.search("python")
+    assert [url for url, _, _ in results] == ["https://b.test/", "https://a.test/"]
+    assert "[python]" in results[0][2]
+    assert [url for url, _, _ in index.search("py*", limit=1)] == ["https://b.test/"]
+    assert index.search('"') == []
+
+
+def test_search_migrates_index_without_prefix_option(tmp_path):
+    path = str(tmp_path / "index.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE urls (id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE)")
+        conn.execute("CREATE VIRTUAL TABLE page_text USING fts5 (title, body)")
+        conn.execute("INSERT INTO urls (id, url) VALUES (1, 'https://old.test/')")
+        conn.execute("INSERT INTO page_text (rowid, title, body) VALUES (1, 'Old', 'kept after migration')")
+
+    index = main.PageIndex(path)
+    with sqlite3.connect(path) as conn:
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'page_text'").fetchone()[0]
+    assert "prefix='2 3'" in sql
+    assert [url for url, _, _ in index.search("migr*")] == ["https://old.test/"]
@@ -0,0 +1,76 @@
+import pytest
+
+main = pytest.importorskip("main")
+
+
+def test_json_ld_records_and_graph():
+    html = """
+    <script type="application/ld+json">{"@type": "Product", "name": "Lamp"}</script>
+    <script type="application/ld+json">{"@graph": [{"@type": "A"}, {"@type": "B"}]}</script>
+    <script type="application/ld+json">{not json</script>
+    <script>var ignored = {"@type": "X"};</script>
+    """
+    assert main.extract_structured_data(html)["json_ld"] == [
+        {"@type": "Product", "name": "Lamp"}, {"@type": "A"}, {"@type": "B"},
+    ]
+
+
+def test_meta_fields_and_repeated_keys():
+    html = """<head>
+    <meta property="og:title" content="Title">
+    <meta property="og:image" content="1.png"><meta property="og:image" content="2.png">
+    <meta name="Description" content="About">
+    <meta name="viewport" content="width=device-width">
+    </head>"""
+    assert main.extract_structured_data(html)["meta"] == {
+        "og:title": "Title", "og:image": ["1.png", "2.png"], "description": "About",
+    }
+
+
+def test_microdata_nested_items_and_value_attributes():
+    html = """
+    <div itemscope itemtype="https://schema.org/Product">
+      <span itemprop="name">  Desk
+        lamp </span>
+      <img itemprop="image" src="lamp.png">
+      <a itemprop="url" href="/lamp">link text</a>
+      <time itemprop="released" datetime="2025-01-01">January</time>
+      <div itemprop="offers" itemscope itemtype="https://schema.org/Offer">
+        <meta itemprop="price" content="9.99">
+        <input itemprop="sku">
+      </div>
+    </div>
+    """
+    assert main.extract_structured_data(html)["microdata"] == [{
+        "type": "https://schema.org/Product",
+        "properties": {
+            "name": ["Desk lamp"],
+            "image": ["lamp.png"],
+            "url": ["/lamp"],
+            "released": ["2025-01-01"],
+            "offers": [{"type": "https://schema.org/Offer", "properties": {"price": ["9.99"], "sku": [""]}}],
+        },
+    }]
+
+
+def test_implied_end_tags_close_unclosed_properties():
+    html = '<ul itemscope><li itemprop="a">one<li itemprop="b">two</ul><p itemprop="c">outside'
+    assert main.extract_structured_data(html)["microdata"] == [
+        {"type": None, "properties": {"a": ["one"], "b": ["two"]}},
+    ]
+
+
+def test_script_style_and_rcdata_text_is_not_markup():
+    html = """<title>A <b itemprop="fake">title</b></title>
+    <div itemscope>
+      <style>.x { content: "<span itemprop='fake'>" }</style>
+      <textarea itemprop="t"><span itemprop="fake">no</span> &amp; more</textarea>
+      <span itemprop="real">yes</span>
+    </div>"""
+    assert main.extract_structured_data(html)["microdata"] == [
+        {"type": None, "properties": {"t": ['<span itemprop="fake">no</span> & more'], "real": ["yes"]}},
+    ]
+
+
+def test_page_without_markers():
+    assert main.extract_structured_data("<p>plain</p>") == {"json_ld": [], "microdata": [], "meta": {}}